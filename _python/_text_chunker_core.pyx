@@ -0,0 +1,97 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Kompilierte Hot-Paths für den TextChunker.
+
+Optionale Beschleunigung für ``_parse_timestamped``/``_parse_generic`` und die
+Zähl-Statistiken in ``_calculate_statistics``. Bauen mit::
+
+    cythonize -i _python/_text_chunker_core.pyx
+
+Ohne kompilierte Extension nutzt ``text_chunker`` die Python-Implementierung.
+"""
+
+from sys import intern
+
+
+cpdef list parse_messages(str text, object pattern, bint want_timestamps,
+                          object parse_timestamp):
+    """Parst Messages; Gruppen (Zeitstempel, Sprecher, Text) bzw. (Sprecher, Text)."""
+    cdef list messages = []
+    cdef list matches = list(pattern.finditer(text))
+    cdef Py_ssize_t n = len(matches)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t message_end
+    cdef int speaker_group = 2 if want_timestamps else 1
+    cdef int body_group = 3 if want_timestamps else 2
+    cdef object match
+    cdef object timestamp
+    cdef str message
+    cdef str rest
+
+    for i in range(n):
+        match = matches[i]
+        if i + 1 < n:
+            message_end = matches[i + 1].start()
+        else:
+            message_end = len(text)
+
+        if want_timestamps:
+            timestamp = parse_timestamp(match.group(1))
+        else:
+            timestamp = None
+
+        # Folgezeilen mit "\n" an die erste Zeile hängen (wie die Python-Variante)
+        message = match.group(body_group)
+        rest = text[match.end():message_end].strip()
+        if rest:
+            message = message + "\n" + rest
+
+        messages.append({
+            'speaker': intern(match.group(speaker_group).strip()),
+            'text': message.strip(),
+            'timestamp': timestamp,
+            'ts_str': str(timestamp) if timestamp else None,
+            'start_pos': match.start(),
+            'end_pos': message_end
+        })
+
+    return messages
+
+
+cpdef tuple calc_counts(list chunks):
+    """Summiert Wörter/Zeichen und zählt pro Sprecher und Chunk-Typ.
+
+    Returns:
+        (total_words, total_chars, speaker_stats, type_counts) mit
+        type_counts als Dict ChunkType -> Anzahl
+    """
+    cdef long long total_words = 0
+    cdef long long total_chars = 0
+    cdef long long words
+    cdef long long chars
+    cdef dict speaker_stats = {}
+    cdef dict type_counts = {}
+    cdef dict stats
+    cdef object chunk
+    cdef object chunk_type
+    cdef object speaker
+
+    for chunk in chunks:
+        words = chunk.word_count
+        chars = chunk.char_count
+        total_words += words
+        total_chars += chars
+
+        chunk_type = chunk.type
+        type_counts[chunk_type] = type_counts.get(chunk_type, 0) + 1
+
+        speaker = chunk.speaker
+        if speaker:
+            stats = speaker_stats.get(speaker.name)
+            if stats is None:
+                stats = {'chunks': 0, 'words': 0, 'chars': 0}
+                speaker_stats[speaker.name] = stats
+            stats['chunks'] += 1
+            stats['words'] += words
+            stats['chars'] += chars
+
+    return total_words, total_chars, speaker_stats, type_counts
@@ -156,6 +156,17 @@ class AggregationConfig(BaseModel):
         default=3,
         description="Fenster für Glättung"
     )
+    
+    parallel: bool = Field(
+        default=False,
+        description="Ob Scores, Marker und Heatmaps parallel in Threads aggregiert werden"
+    )
+    
+    stream_block_size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Blockgröße für blockweise Aggregation großer Eingaben (None = alles auf einmal)"
+    )
 
 
 class HeatmapData(BaseModel):
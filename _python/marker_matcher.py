@@ -75,6 +75,7 @@ class MarkerMatcher:
         """Initialisiert den Matcher mit Marker-Daten"""
         self.markers = {}
         self.semantic_detectors = {}
+        self._regex_cache: Dict[str, re.Pattern] = {}
         self.risk_thresholds = {
             'green': (0, 1),
             'yellow': (2, 5),
@@ -210,8 +211,11 @@ class MarkerMatcher:
             for pattern_rule in semantic_data['patterns']:
                 if 'pattern' in pattern_rule:
                     try:
-                        # Kompiliere Regex-Pattern
-                        regex = re.compile(pattern_rule['pattern'], re.IGNORECASE)
+                        # Kompiliere Regex-Pattern (einmal pro Matcher)
+                        regex = self._regex_cache.get(pattern_rule['pattern'])
+                        if regex is None:
+                            regex = re.compile(pattern_rule['pattern'], re.IGNORECASE)
+                            self._regex_cache[pattern_rule['pattern']] = regex
                         
                         for match in regex.finditer(text):
                             marker_match = MarkerMatch(
@@ -292,11 +296,9 @@ class MarkerMatcher:
         return summary
     
     def analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
-        """Analysiert mehrere Texte"""
-        results = []
-        for text in texts:
-            results.append(self.analyze_text(text))
-        return results
+        """Analysiert mehrere Texte (kompilierte Patterns werden wiederverwendet)"""
+        analyze_text = self.analyze_text
+        return [analyze_text(text) for text in texts]
 
 
 def main():
@@ -6,6 +6,11 @@ Einfacher Test für das CoSD-Modul
 import sys
 import os
 
+import requests
+
+# Eine Session für alle API-Aufrufe (Keep-Alive, wiederverwendete Header)
+_SESSION = requests.Session()
+
 # Füge das aktuelle Verzeichnis zum Python-Pfad hinzu
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -43,28 +48,29 @@ def test_cosd_analyzer():
         
         for i, text in enumerate(test_texts, 1):
             print(f"\n   Text {i}: '{text[:50]}...'")
+        
+        try:
+            # Alle Texte in einem Aufruf analysieren
+            result = analyzer.analyze_drift(test_texts)
+            print(f"\n   ✅ Analyse erfolgreich")
             
-            try:
-                result = analyzer.analyze_drift([text])
-                print(f"   ✅ Analyse erfolgreich")
-                
-                # Verwende die richtigen Attribute
-                if hasattr(result, 'drift_velocity') and result.drift_velocity:
-                    avg_velocity = result.drift_velocity.get('average_velocity', 0)
-                    print(f"      Drift-Velocity: {avg_velocity:.3f}")
-                
-                if hasattr(result, 'emergent_clusters'):
-                    print(f"      Emergente Cluster: {len(result.emergent_clusters)}")
-                
-                if hasattr(result, 'risk_assessment'):
-                    risk_level = result.risk_assessment.get('risk_level', 'unknown')
-                    print(f"      Risk-Level: {risk_level}")
+            # Verwende die richtigen Attribute
+            if hasattr(result, 'drift_velocity') and result.drift_velocity:
+                avg_velocity = result.drift_velocity.get('average_velocity', 0)
+                print(f"      Drift-Velocity: {avg_velocity:.3f}")
+            
+            if hasattr(result, 'emergent_clusters'):
+                print(f"      Emergente Cluster: {len(result.emergent_clusters)}")
+            
+            if hasattr(result, 'risk_assessment'):
+                risk_level = result.risk_assessment.get('risk_level', 'unknown')
+                print(f"      Risk-Level: {risk_level}")
+            
+            if hasattr(result, 'resonance_patterns'):
+                print(f"      Resonanz-Muster: {len(result.resonance_patterns)}")
                 
-                if hasattr(result, 'resonance_patterns'):
-                    print(f"      Resonanz-Muster: {len(result.resonance_patterns)}")
-                    
-            except Exception as e:
-                print(f"   ❌ Analyse-Fehler: {e}")
+        except Exception as e:
+            print(f"   ❌ Analyse-Fehler: {e}")
         
         return True
         
@@ -77,10 +83,8 @@ def test_chat_integration():
     print("\n💬 Teste Chat-Integration...")
     
     try:
-        import requests
-        
         # Teste ob Chat-Server läuft
-        response = requests.get("http://localhost:5001/api/cosd/status", timeout=2)
+        response = _SESSION.get("http://localhost:5001/api/cosd/status", timeout=2)
         
         if response.status_code == 200:
             status = response.json()
@@ -7,6 +7,9 @@ import requests
 import json
 from marker_matcher import MarkerMatcher
 
+# Eine Session für alle API-Aufrufe (Keep-Alive, wiederverwendete Header)
+_SESSION = requests.Session()
+
 def test_direct_api():
     """Test der direkten Python-API"""
     print("🔍 Teste direkte Python-API...")
@@ -26,9 +29,11 @@ def test_direct_api():
         "Ich schwanke zwischen Enthusiasmus und Zweifel, ich kann mich nicht entscheiden."  # AMBIVALENZMARKER
     ]
     
-    for text in test_texts:
+    # Alle Texte in einem Batch-Aufruf analysieren
+    results = matcher.analyze_batch(test_texts)
+    
+    for text, result in zip(test_texts, results):
         print(f"\n📝 Analysiere: '{text}'")
-        result = matcher.analyze_text(text)
         
         print(f"   Risk-Level: {result.risk_level}")
         print(f"   Gefundene Marker: {len(result.gefundene_marker)}")
@@ -46,7 +51,7 @@ def test_rest_api():
     test_data = {"text": "Ey, Alter, das reicht jetzt. Ich bin hier raus."}
     
     try:
-        response = requests.post(f"{base_url}/analyze", 
+        response = _SESSION.post(f"{base_url}/analyze", 
                                json=test_data, 
                                headers={"Content-Type": "application/json"})
         
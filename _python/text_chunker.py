@@ -1,7 +1,10 @@
 """Text Chunker für intelligente Text-Segmentierung."""
 
 import re
+import sys
 import time
+from collections import Counter
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Dict, Any
 import logging
@@ -11,9 +14,47 @@ from .chunk_models import (
     TextChunk, ChunkType, Speaker, ChunkingConfig, ChunkingResult
 )
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba ist optional
+    njit = None
+
+try:
+    from ._text_chunker_core import parse_messages as _parse_messages_c
+    from ._text_chunker_core import calc_counts as _calc_counts_c
+except ImportError:  # Cython-Extension nicht gebaut
+    _parse_messages_c = None
+    _calc_counts_c = None
+
 logger = logging.getLogger(__name__)
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _reduce_stats(word_counts, char_counts, speaker_ids, type_ids,
+                      n_speakers, n_types):
+        """Numerische Reduktion der Chunk-Statistiken (speaker_id -1 = kein Sprecher)."""
+        total_words = 0
+        total_chars = 0
+        speaker_counts = np.zeros((n_speakers, 3), dtype=np.int64)
+        type_counts = np.zeros(n_types, dtype=np.int64)
+        
+        for i in range(word_counts.shape[0]):
+            total_words += word_counts[i]
+            total_chars += char_counts[i]
+            type_counts[type_ids[i]] += 1
+            sid = speaker_ids[i]
+            if sid >= 0:
+                speaker_counts[sid, 0] += 1
+                speaker_counts[sid, 1] += word_counts[i]
+                speaker_counts[sid, 2] += char_counts[i]
+        
+        return total_words, total_chars, speaker_counts, type_counts
+else:
+    _reduce_stats = None
+
+
 class TextChunker:
     """Segmentiert Texte intelligent in analysierbare Chunks."""
     
@@ -28,8 +69,10 @@ class TextChunker:
         re.MULTILINE
     )
     
+    # Sprecher: beginnt mit Buchstabe, max. 41 Zeichen, Whitespace nach dem Doppelpunkt
+    # (vermeidet Treffer auf URLs, Uhrzeiten, Verhältnisse etc.)
     GENERIC_PATTERN = re.compile(
-        r'^([^:]+):\s*(.*)',
+        r'^([A-Za-zÄÖÜäöüß][^:\n]{0,40}):\s+(.*)',
         re.MULTILINE
     )
     
@@ -42,9 +85,27 @@ class TextChunker:
         re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}'),
     ]
     
+    # Whitespace-Normalisierung
+    _WS_RE = re.compile(r'\s+')
+    
+    # Bis zu dieser Textlänge wird die Format-Erkennung gecached
+    FORMAT_PROBE_SIZE = 4096
+    
+    # Ab dieser Chunk-Anzahl werden Statistiken mit Numba reduziert (falls installiert)
+    NUMBA_MIN_CHUNKS = 10000
+    
     def __init__(self, config: Optional[ChunkingConfig] = None):
         self.config = config or ChunkingConfig()
         self._speaker_map: Dict[str, Speaker] = {}
+        # Chunk-IDs: ein zufälliges Präfix pro Instanz + fortlaufender Zähler
+        self._id_prefix = uuid4().hex[:6]
+        self._chunk_counter = 0
+        # Format-spezifische Parser (Dispatch statt Verzweigung pro Match)
+        self._parsers = {
+            "whatsapp": self._parse_whatsapp,
+            "telegram": self._parse_telegram,
+            "generic": self._parse_generic,
+        }
         
     def chunk_text(
         self, 
@@ -65,7 +126,14 @@ class TextChunker:
         
         try:
             # Format erkennen
-            chat_format = format_hint or self._detect_format(text)
+            chat_format = format_hint
+            if not chat_format:
+                if len(text) <= self.FORMAT_PROBE_SIZE:
+                    chat_format = self._detect_format_cached(text)
+                else:
+                    # Lange Texte ungecached: ein höher priorisiertes Format
+                    # kann noch spät im Text stehen
+                    chat_format = self._detect_format(text)
             logger.info(f"Erkanntes Format: {chat_format}")
             
             # Parse Messages
@@ -97,17 +165,48 @@ class TextChunker:
         result.processing_time = time.time() - start_time
         return result
     
-    def _detect_format(self, text: str) -> str:
-        """Erkennt das Chat-Format automatisch."""
-        # Teste verschiedene Patterns
-        if self.WHATSAPP_PATTERN.search(text):
+    def chunk_texts(
+        self,
+        texts: List[str],
+        format_hint: Optional[str] = None,
+        reset_speakers: bool = False
+    ) -> List[ChunkingResult]:
+        """Segmentiert mehrere Texte nacheinander mit chunk_text.
+        
+        Reiner Komfort-Wrapper ohne eigenen Geschwindigkeitsvorteil. Die
+        Speaker-Map bleibt über den Batch erhalten, sodass Sprecher-IDs
+        textübergreifend stabil sind.
+        
+        Args:
+            texts: Die zu segmentierenden Texte
+            format_hint: Hinweis auf Format für alle Texte
+            reset_speakers: Speaker-Map vor dem Batch zurücksetzen
+            
+        Returns:
+            Liste von ChunkingResults in der Reihenfolge der Eingabe
+        """
+        if reset_speakers:
+            self._speaker_map = {}
+        
+        chunk_text = self.chunk_text
+        return [chunk_text(text, format_hint) for text in texts]
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _detect_format_cached(cls, text: str) -> str:
+        """Erkennt das Format kurzer Texte (gecached pro Text)."""
+        return cls._detect_format(text)
+    
+    @classmethod
+    def _detect_format(cls, text: str) -> str:
+        """Erkennt das Chat-Format automatisch (WhatsApp vor Telegram vor generisch)."""
+        if cls.WHATSAPP_PATTERN.search(text):
             return "whatsapp"
-        elif self.TELEGRAM_PATTERN.search(text):
+        if cls.TELEGRAM_PATTERN.search(text):
             return "telegram"
-        elif self.GENERIC_PATTERN.search(text):
+        if cls.GENERIC_PATTERN.search(text):
             return "generic"
-        else:
-            return "plain"
+        return "plain"
     
     def _parse_messages(
         self, 
@@ -115,53 +214,83 @@ class TextChunker:
         format_type: str
     ) -> List[Dict[str, Any]]:
         """Parst Messages aus dem Text basierend auf Format."""
-        messages = []
-        
-        if format_type == "whatsapp":
-            pattern = self.WHATSAPP_PATTERN
-        elif format_type == "telegram":
-            pattern = self.TELEGRAM_PATTERN
-        elif format_type == "generic":
-            pattern = self.GENERIC_PATTERN
-        else:
+        parser = self._parsers.get(format_type)
+        if parser is None:
             # Plain text - keine Messages
             return []
+        return parser(text)
+    
+    def _parse_whatsapp(self, text: str) -> List[Dict[str, Any]]:
+        """Parst WhatsApp-Exporte."""
+        return self._parse_timestamped(text, self.WHATSAPP_PATTERN)
+    
+    def _parse_telegram(self, text: str) -> List[Dict[str, Any]]:
+        """Parst Telegram-Exporte."""
+        return self._parse_timestamped(text, self.TELEGRAM_PATTERN)
+    
+    def _parse_timestamped(
+        self,
+        text: str,
+        pattern: "re.Pattern[str]"
+    ) -> List[Dict[str, Any]]:
+        """Parst Messages mit Gruppen (Zeitstempel, Sprecher, Text)."""
+        if _parse_messages_c is not None:
+            return _parse_messages_c(text, pattern, True, self._parse_timestamp)
         
-        last_end = 0
+        messages = []
+        parse_timestamp = self._parse_timestamp
         
-        for match in pattern.finditer(text):
-            if format_type in ["whatsapp", "telegram"]:
-                timestamp_str, speaker, message = match.groups()
-                timestamp = self._parse_timestamp(timestamp_str)
-            else:
-                speaker, message = match.groups()
-                timestamp = None
-            
-            # Multi-line Messages zusammenführen
-            start = match.start()
-            end = match.end()
-            
-            # Finde nächste Message oder Ende
-            next_match = pattern.search(text, end)
-            if next_match:
-                message_end = next_match.start()
-            else:
-                message_end = len(text)
+        # Message-Grenzen aus den Starts der Folge-Matches ableiten,
+        # statt pro Match erneut zu suchen
+        matches = list(pattern.finditer(text))
+        message_ends = [m.start() for m in matches[1:]]
+        message_ends.append(len(text))
+        
+        for match, message_end in zip(matches, message_ends):
+            timestamp = parse_timestamp(match.group(1))
             
-            # Erweitere Message bis zur nächsten
-            full_message = text[match.end():message_end].strip()
-            if full_message:
-                message = message + "\n" + full_message
+            # Folgezeilen bis zur nächsten Message wie bisher mit "\n" anhängen
+            message = match.group(3)
+            rest = text[match.end():message_end].strip()
+            if rest:
+                message = message + "\n" + rest
             
             messages.append({
-                'speaker': speaker.strip(),
+                'speaker': sys.intern(match.group(2).strip()),
                 'text': message.strip(),
                 'timestamp': timestamp,
-                'start_pos': start,
+                'ts_str': str(timestamp) if timestamp else None,
+                'start_pos': match.start(),
                 'end_pos': message_end
             })
+        
+        return messages
+    
+    def _parse_generic(self, text: str) -> List[Dict[str, Any]]:
+        """Parst generische "Sprecher: Text"-Zeilen ohne Zeitstempel."""
+        if _parse_messages_c is not None:
+            return _parse_messages_c(text, self.GENERIC_PATTERN, False, None)
+        
+        messages = []
+        
+        matches = list(self.GENERIC_PATTERN.finditer(text))
+        message_ends = [m.start() for m in matches[1:]]
+        message_ends.append(len(text))
+        
+        for match, message_end in zip(matches, message_ends):
+            message = match.group(2)
+            rest = text[match.end():message_end].strip()
+            if rest:
+                message = message + "\n" + rest
             
-            last_end = message_end
+            messages.append({
+                'speaker': sys.intern(match.group(1).strip()),
+                'text': message.strip(),
+                'timestamp': None,
+                'ts_str': None,
+                'start_pos': match.start(),
+                'end_pos': message_end
+            })
         
         return messages
     
@@ -194,6 +323,7 @@ class TextChunker:
         """Erstellt Chunks aus geparsten Messages."""
         chunks = []
         current_chunk_messages = []
+        current_size = 0
         current_speaker = None
         last_timestamp = None
         
@@ -215,55 +345,66 @@ class TextChunker:
                 need_new_chunk = True
             
             # Bei Größenlimit
-            current_size = sum(len(m['text']) for m in current_chunk_messages)
-            if current_size + len(msg['text']) > self.config.max_chunk_size:
+            msg_size = len(msg['text'])
+            if current_size + msg_size > self.config.max_chunk_size:
                 need_new_chunk = True
             
             # Erstelle neuen Chunk wenn nötig
             if need_new_chunk and current_chunk_messages:
                 chunk = self._create_chunk_from_messages(current_chunk_messages)
-                chunks.append(chunk)
+                self._append_linked(chunks, chunk)
                 current_chunk_messages = []
+                current_size = 0
             
             current_chunk_messages.append(msg)
+            current_size += msg_size
             current_speaker = speaker_name
             last_timestamp = timestamp
         
         # Letzten Chunk erstellen
         if current_chunk_messages:
             chunk = self._create_chunk_from_messages(current_chunk_messages)
-            chunks.append(chunk)
-        
-        # Chunk-IDs verlinken
-        for i in range(len(chunks)):
-            if i > 0:
-                chunks[i].previous_chunk_id = chunks[i-1].id
-            if i < len(chunks) - 1:
-                chunks[i].next_chunk_id = chunks[i+1].id
+            self._append_linked(chunks, chunk)
         
         return chunks
     
+    @staticmethod
+    def _append_linked(chunks: List[TextChunk], chunk: TextChunk) -> None:
+        """Hängt einen Chunk an und verlinkt ihn mit seinem Vorgänger."""
+        if chunks:
+            prev_chunk = chunks[-1]
+            chunk.previous_chunk_id = prev_chunk.id
+            prev_chunk.next_chunk_id = chunk.id
+        chunks.append(chunk)
+    
     def _create_chunk_from_messages(
         self, 
         messages: List[Dict[str, Any]]
     ) -> TextChunk:
         """Erstellt einen Chunk aus einer Liste von Messages."""
         # Text zusammenführen
-        texts = []
-        for msg in messages:
-            if msg['timestamp']:
-                texts.append(f"[{msg['timestamp']}] {msg['speaker']}: {msg['text']}")
-            else:
-                texts.append(f"{msg['speaker']}: {msg['text']}")
+        texts = [
+            f"[{msg['ts_str']}] {msg['speaker']}: {msg['text']}" if msg['ts_str']
+            else f"{msg['speaker']}: {msg['text']}"
+            for msg in messages
+        ]
         
         combined_text = "\n".join(texts)
         
-        # Speaker bestimmen
-        speakers = list(set(msg['speaker'] for msg in messages))
-        if len(speakers) == 1:
-            speaker = self._get_or_create_speaker(speakers[0])
-        else:
+        # Speaker bestimmen (Abbruch beim ersten abweichenden Sprecher)
+        first_speaker = messages[0]['speaker']
+        multi_speaker = False
+        for msg in messages[1:]:
+            if msg['speaker'] != first_speaker:
+                multi_speaker = True
+                break
+        
+        if multi_speaker:
+            speakers = list(dict.fromkeys(msg['speaker'] for msg in messages))
             speaker = None  # Multiple speakers in chunk
+        else:
+            speakers = [first_speaker]
+            speaker = self._get_or_create_speaker(first_speaker)
         
         # Timestamps
         timestamps = [msg['timestamp'] for msg in messages if msg['timestamp']]
@@ -271,7 +412,7 @@ class TextChunker:
         
         return self._create_chunk(
             text=combined_text,
-            chunk_type=ChunkType.CONVERSATION if len(speakers) > 1 else ChunkType.MESSAGE,
+            chunk_type=ChunkType.CONVERSATION if multi_speaker else ChunkType.MESSAGE,
             speaker=speaker,
             timestamp=timestamp,
             start_pos=messages[0]['start_pos'],
@@ -293,11 +434,16 @@ class TextChunker:
         metadata: Optional[Dict[str, Any]] = None
     ) -> TextChunk:
         """Erstellt einen einzelnen Chunk."""
-        chunk_id = f"chunk_{uuid4().hex[:8]}"
+        self._chunk_counter += 1
+        chunk_id = f"chunk_{self._id_prefix}{self._chunk_counter:x}"
         
-        # Text normalisieren wenn gewünscht
+        # Text normalisieren wenn gewünscht; danach trennt genau ein
+        # Leerzeichen die Wörter und die Counts brauchen kein split()
+        counts = {}
         if self.config.normalize_whitespace:
-            text = ' '.join(text.split())
+            text = self._WS_RE.sub(' ', text).strip()
+            if text:
+                counts = {'word_count': text.count(' ') + 1, 'char_count': len(text)}
         
         return TextChunk(
             id=chunk_id,
@@ -307,27 +453,27 @@ class TextChunker:
             timestamp=timestamp,
             start_pos=start_pos,
             end_pos=end_pos,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            **counts
         )
     
     def _get_or_create_speaker(self, name: str) -> Speaker:
         """Holt oder erstellt einen Speaker."""
-        if name not in self._speaker_map:
+        name = sys.intern(name)
+        speaker = self._speaker_map.get(name)
+        if speaker is None:
             speaker_id = f"speaker_{len(self._speaker_map) + 1}"
-            self._speaker_map[name] = Speaker(
+            speaker = self._speaker_map[name] = Speaker(
                 id=speaker_id,
                 name=name
             )
-        return self._speaker_map[name]
+        return speaker
     
     def _calculate_statistics(self, chunks: List[TextChunk]) -> Dict[str, Any]:
         """Berechnet Statistiken über die Chunks."""
         if not chunks:
             return {}
         
-        total_words = sum(c.word_count for c in chunks)
-        total_chars = sum(c.char_count for c in chunks)
-        
         # Zeitspanne
         timestamps = [c.timestamp for c in chunks if c.timestamp]
         if timestamps:
@@ -336,20 +482,36 @@ class TextChunker:
         else:
             time_span_hours = 0
         
-        # Speaker-Statistiken
-        speaker_stats = {}
-        for chunk in chunks:
-            if chunk.speaker:
-                speaker_name = chunk.speaker.name
-                if speaker_name not in speaker_stats:
-                    speaker_stats[speaker_name] = {
-                        'chunks': 0,
-                        'words': 0,
-                        'chars': 0
-                    }
-                speaker_stats[speaker_name]['chunks'] += 1
-                speaker_stats[speaker_name]['words'] += chunk.word_count
-                speaker_stats[speaker_name]['chars'] += chunk.char_count
+        if _calc_counts_c is not None:
+            total_words, total_chars, speaker_stats, type_counts = _calc_counts_c(chunks)
+            chunk_types = {t.value: type_counts.get(t, 0) for t in ChunkType}
+        elif _reduce_stats is not None and len(chunks) >= self.NUMBA_MIN_CHUNKS:
+            total_words, total_chars, speaker_stats, chunk_types = \
+                self._reduce_statistics_numba(chunks)
+        else:
+            total_words = 0
+            total_chars = 0
+            type_counts = Counter()
+            
+            # Speaker-Statistiken und Typ-Zählung in einem Durchlauf
+            speaker_stats = {}
+            for chunk in chunks:
+                total_words += chunk.word_count
+                total_chars += chunk.char_count
+                type_counts[chunk.type] += 1
+                if chunk.speaker:
+                    speaker_name = chunk.speaker.name
+                    if speaker_name not in speaker_stats:
+                        speaker_stats[speaker_name] = {
+                            'chunks': 0,
+                            'words': 0,
+                            'chars': 0
+                        }
+                    speaker_stats[speaker_name]['chunks'] += 1
+                    speaker_stats[speaker_name]['words'] += chunk.word_count
+                    speaker_stats[speaker_name]['chars'] += chunk.char_count
+            
+            chunk_types = {t.value: type_counts[t] for t in ChunkType}
         
         return {
             'total_chunks': len(chunks),
@@ -358,8 +520,52 @@ class TextChunker:
             'avg_chunk_size': total_chars / len(chunks) if chunks else 0,
             'time_span_hours': time_span_hours,
             'speaker_stats': speaker_stats,
-            'chunk_types': {
-                t.value: sum(1 for c in chunks if c.type == t)
-                for t in ChunkType
+            'chunk_types': chunk_types
+        }
+    
+    def _reduce_statistics_numba(
+        self,
+        chunks: List[TextChunk]
+    ) -> Tuple[int, int, Dict[str, Dict[str, int]], Dict[str, int]]:
+        """Zählt Wörter, Zeichen, Sprecher und Typen über Numba-Arrays."""
+        chunk_types = list(ChunkType)
+        type_index = {t: i for i, t in enumerate(chunk_types)}
+        speaker_index: Dict[str, int] = {}
+        
+        n = len(chunks)
+        word_counts = np.empty(n, dtype=np.int64)
+        char_counts = np.empty(n, dtype=np.int64)
+        speaker_ids = np.empty(n, dtype=np.int64)
+        type_ids = np.empty(n, dtype=np.int64)
+        
+        for i, chunk in enumerate(chunks):
+            word_counts[i] = chunk.word_count
+            char_counts[i] = chunk.char_count
+            type_ids[i] = type_index[chunk.type]
+            if chunk.speaker:
+                speaker_ids[i] = speaker_index.setdefault(
+                    chunk.speaker.name, len(speaker_index)
+                )
+            else:
+                speaker_ids[i] = -1
+        
+        total_words, total_chars, speaker_counts, type_counts = _reduce_stats(
+            word_counts, char_counts, speaker_ids, type_ids,
+            len(speaker_index), len(chunk_types)
+        )
+        
+        speaker_stats = {
+            name: {
+                'chunks': int(speaker_counts[sid, 0]),
+                'words': int(speaker_counts[sid, 1]),
+                'chars': int(speaker_counts[sid, 2])
             }
-        }
\ No newline at end of file
+            for name, sid in speaker_index.items()
+        }
+        
+        return (
+            int(total_words),
+            int(total_chars),
+            speaker_stats,
+            {t.value: int(type_counts[i]) for i, t in enumerate(chunk_types)}
+        )
\ No newline at end of file
@@ -2,11 +2,14 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+from pandas.tseries.frequencies import to_offset
 
 from .aggregation_models import (
     AggregationConfig, AggregationPeriod, AggregationResult,
@@ -18,6 +21,104 @@ from ..matcher.marker_models import MarkerMatch, MarkerCategory
 logger = logging.getLogger(__name__)
 
 
+# Pandas-Frequenzen der Aggregationszeiträume (CUSTOM: f"{stunden}h")
+FREQ_MAP = {
+    AggregationPeriod.HOURLY: "h",
+    AggregationPeriod.DAILY: "D",
+    AggregationPeriod.WEEKLY: "W-MON",
+    AggregationPeriod.MONTHLY: "MS",
+    AggregationPeriod.QUARTERLY: "QS",
+    AggregationPeriod.YEARLY: "YS",
+}
+
+# Integer-Codes für Kategorien und Score-Typen (Index = Code)
+CAT_FROM_CODE: Tuple[MarkerCategory, ...] = tuple(MarkerCategory)
+CAT_CODE: Dict[MarkerCategory, int] = {c: i for i, c in enumerate(CAT_FROM_CODE)}
+SCORE_FROM_CODE: Tuple[ScoreType, ...] = tuple(ScoreType)
+SCORE_CODE: Dict[ScoreType, int] = {t: i for i, t in enumerate(SCORE_FROM_CODE)}
+
+
+@lru_cache(maxsize=64)
+def _time_windows(
+    start: datetime,
+    end: datetime,
+    freq: str,
+    tz_key: str
+) -> Tuple[Tuple[datetime, datetime], ...]:
+    """Kalender-ausgerichtete Zeitfenster, die [start, end] abdecken (gecacht).
+    
+    tz_key gehört nur zum Cache-Key: gleiche Zeitpunkte in verschiedenen
+    Zeitzonen sind gleich und hätten sonst denselben Eintrag.
+    """
+    offset = to_offset(freq)
+    
+    # Erste Kante auf den Periodenanfang legen
+    first = pd.Timestamp(start)
+    if isinstance(offset, pd.offsets.Tick):
+        # Bei Zeitzonen mit Sommerzeit die doppelte Stunde eindeutig auflösen
+        first = first.floor(
+            offset, ambiguous=bool(first.dst()), nonexistent="shift_backward"
+        )
+    else:
+        first = offset.rollback(first.normalize())
+    
+    edges = pd.date_range(first, end, freq=offset)
+    # Letzte Kante muss hinter end liegen, damit end im letzten Fenster liegt
+    if edges[-1] <= end:
+        edges = edges.append(pd.DatetimeIndex([edges[-1] + offset]))
+    
+    edges = edges.to_pydatetime()
+    return tuple(zip(edges[:-1], edges[1:]))
+
+
+def _timestamp_column(values: List[datetime]):
+    """Timestamp-Spalte: naive als datetime64[ns]-Array, zeitzonenbehaftete als
+    DatetimeIndex in der Zeitzone des ersten Timestamps (numpy würde sie still
+    nach UTC verschieben und die Zeitzone verwerfen)."""
+    if values and values[0].tzinfo is not None:
+        return pd.to_datetime(values, utc=True).tz_convert(values[0].tzinfo).as_unit("ns")
+    return np.array(values, dtype="datetime64[ns]")
+
+
+def _sort_by_time(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Sortiert alle Spalten-Arrays gemeinsam stabil nach "timestamp"."""
+    order = np.argsort(columns["timestamp"], kind="stable")
+    return {name: values[order] for name, values in columns.items()}
+
+
+def _scores_to_soa(chunk_scores: List[ChunkScore]) -> Dict[str, np.ndarray]:
+    """Wandelt Chunk-Scores mit Timestamp einmalig in Spalten-Arrays um."""
+    timed_scores = [s for s in chunk_scores if s.timestamp]
+    n = len(timed_scores)
+    return _sort_by_time({
+        "timestamp": _timestamp_column([s.timestamp for s in timed_scores]),
+        "type": np.fromiter(
+            (SCORE_CODE[s.score_type] for s in timed_scores), dtype=np.int16, count=n
+        ),
+        "score": np.fromiter(
+            (s.normalized_score for s in timed_scores), dtype=np.float64, count=n
+        ),
+        "confidence": np.fromiter(
+            (s.confidence for s in timed_scores), dtype=np.float64, count=n
+        ),
+        "speaker": np.array(
+            [s.metadata.get("speaker", "Unknown") for s in timed_scores], dtype=object
+        ),
+    })
+
+
+def _matches_to_soa(marker_matches: List[MarkerMatch]) -> Dict[str, np.ndarray]:
+    """Wandelt Marker-Matches mit Timestamp einmalig in Spalten-Arrays um."""
+    timed_matches = [m for m in marker_matches if m.timestamp]
+    return _sort_by_time({
+        "timestamp": _timestamp_column([m.timestamp for m in timed_matches]),
+        "category": np.fromiter(
+            (CAT_CODE[m.category] for m in timed_matches),
+            dtype=np.int16, count=len(timed_matches)
+        ),
+    })
+
+
 class TimeSeriesAggregator:
     """Aggregiert Scores und Marker-Daten über verschiedene Zeitfenster."""
     
@@ -41,26 +142,83 @@ class TimeSeriesAggregator:
             AggregationResult mit allen aggregierten Daten
         """
         start_time = time.time()
+        return self._aggregate_soa(
+            _scores_to_soa(chunk_scores),
+            _matches_to_soa(marker_matches),
+            period,
+            start_time
+        )
+    
+    def aggregate_arrays(
+        self,
+        scores: Dict[str, np.ndarray],
+        markers: Dict[str, np.ndarray],
+        period: Optional[AggregationPeriod] = None
+    ) -> AggregationResult:
+        """Aggregiert bereits spaltenweise vorliegende Daten.
+        
+        Args:
+            scores: Arrays "timestamp" (datetime64 oder tz-behafteter
+                DatetimeIndex), "type" (SCORE_CODE),
+                "score", "confidence" und "speaker" gleicher Länge
+            markers: Arrays "timestamp" (wie bei scores) und "category" (CAT_CODE)
+            period: Aggregationszeitraum (überschreibt config)
+            
+        Returns:
+            AggregationResult mit allen aggregierten Daten
+        """
+        start_time = time.time()
+        return self._aggregate_soa(
+            _sort_by_time(scores),
+            _sort_by_time(markers),
+            period,
+            start_time
+        )
+    
+    def _aggregate_soa(
+        self,
+        scores: Dict[str, np.ndarray],
+        markers: Dict[str, np.ndarray],
+        period: Optional[AggregationPeriod],
+        start_time: float
+    ) -> AggregationResult:
+        """Führt alle Aggregationsstufen auf den nach Zeit sortierten Spalten-Arrays aus."""
         result = AggregationResult()
         
         # Verwende spezifizierten oder konfigurierten Zeitraum
         agg_period = period or self.config.period
         
         try:
-            # Aggregiere Scores
-            score_series = self._aggregate_scores(chunk_scores, agg_period)
-            result.time_series.update(score_series)
-            
-            # Aggregiere Marker-Counts
-            marker_series = self._aggregate_markers(marker_matches, agg_period)
-            result.time_series.update(marker_series)
-            
-            # Erstelle Heatmaps
-            result.heatmaps = self._create_heatmaps(
-                chunk_scores,
-                marker_matches,
-                agg_period
-            )
+            if self.config.parallel:
+                # Unabhängige Stufen überlappen (NumPy/pandas geben den GIL frei)
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    score_future = executor.submit(
+                        self._aggregate_scores, scores, agg_period
+                    )
+                    marker_future = executor.submit(
+                        self._aggregate_markers, markers, agg_period
+                    )
+                    heatmap_future = executor.submit(
+                        self._create_heatmaps, scores, markers, agg_period
+                    )
+                    result.time_series.update(score_future.result())
+                    result.time_series.update(marker_future.result())
+                    result.heatmaps = heatmap_future.result()
+            else:
+                # Aggregiere Scores
+                score_series = self._aggregate_scores(scores, agg_period)
+                result.time_series.update(score_series)
+                
+                # Aggregiere Marker-Counts
+                marker_series = self._aggregate_markers(markers, agg_period)
+                result.time_series.update(marker_series)
+                
+                # Erstelle Heatmaps
+                result.heatmaps = self._create_heatmaps(
+                    scores,
+                    markers,
+                    agg_period
+                )
             
             # Erstelle Vergleiche
             result.comparisons = self._create_comparisons(result.time_series)
@@ -82,44 +240,50 @@ class TimeSeriesAggregator:
     
     def _aggregate_scores(
         self,
-        chunk_scores: List[ChunkScore],
+        scores: Dict[str, np.ndarray],
         period: AggregationPeriod
     ) -> Dict[str, TimeSeriesData]:
         """Aggregiert Chunk-Scores über Zeit."""
         series_dict = {}
         
-        # Gruppiere Scores nach Typ
-        scores_by_type = defaultdict(list)
-        for score in chunk_scores:
-            if score.timestamp:
-                scores_by_type[score.score_type.value].append(score)
+        if not len(scores["timestamp"]):
+            return series_dict
+        
+        # Ein DataFrame für alle Scores, gruppiert nach Typ
+        df = pd.DataFrame(
+            {
+                'type': scores["type"],
+                'score': scores["score"],
+                'confidence': scores["confidence"],
+            },
+            index=pd.DatetimeIndex(scores["timestamp"])
+        )
         
         # Erstelle Zeitreihe für jeden Score-Typ
-        for score_type, scores in scores_by_type.items():
-            if not scores:
-                continue
-            
-            # Sortiere nach Zeit
-            sorted_scores = sorted(scores, key=lambda s: s.timestamp)
+        # groupby erhält die Zeitsortierung der Arrays innerhalb jeder Gruppe
+        for type_code, type_df in df.groupby('type', sort=False):
+            score_type = SCORE_FROM_CODE[type_code].value
             
             # Bestimme Zeitbereich
-            start_time = sorted_scores[0].timestamp
-            end_time = sorted_scores[-1].timestamp
+            start_time = type_df.index[0].to_pydatetime()
+            end_time = type_df.index[-1].to_pydatetime()
             
             # Erstelle Zeitfenster
             time_windows = self._create_time_windows(start_time, end_time, period)
             
-            # Aggregiere in Zeitfenster
+            # Aggregiere in Zeitfenster: Slice-Offsets + reduceat über alle Fenster
+            offsets = self._window_offsets(type_df.index, time_windows)
+            window_stats = self._reduce_windows_blocked(
+                type_df['score'].to_numpy(),
+                type_df['confidence'].to_numpy(),
+                offsets
+            )
+            
             data_points = []
-            for window_start, window_end in time_windows:
-                window_scores = [
-                    s for s in sorted_scores
-                    if window_start <= s.timestamp < window_end
-                ]
-                
-                if window_scores or self.config.include_zero_periods:
+            for (window_start, window_end), stats in zip(time_windows, window_stats):
+                if stats is not None or self.config.include_zero_periods:
                     point = self._create_score_point(
-                        window_scores,
+                        stats,
                         window_start,
                         window_end,
                         score_type
@@ -146,65 +310,75 @@ class TimeSeriesAggregator:
     
     def _aggregate_markers(
         self,
-        marker_matches: List[MarkerMatch],
+        markers: Dict[str, np.ndarray],
         period: AggregationPeriod
     ) -> Dict[str, TimeSeriesData]:
         """Aggregiert Marker-Matches über Zeit."""
         series_dict = {}
         
-        # Filtere Matches mit Timestamps
-        timed_matches = [m for m in marker_matches if m.timestamp]
-        if not timed_matches:
+        if not len(markers["timestamp"]):
             return series_dict
         
-        # Sortiere nach Zeit
-        sorted_matches = sorted(timed_matches, key=lambda m: m.timestamp)
+        timestamps = pd.DatetimeIndex(markers["timestamp"])
         
         # Zeitbereich
-        start_time = sorted_matches[0].timestamp
-        end_time = sorted_matches[-1].timestamp
+        start_time = timestamps[0].to_pydatetime()
+        end_time = timestamps[-1].to_pydatetime()
         
         # Zeitfenster
         time_windows = self._create_time_windows(start_time, end_time, period)
         
+        # Counts pro (Fenster, Kategorie) mit einem bincount über kombinierte Codes
+        categories = [category.value for category in CAT_FROM_CODE]
+        n_categories = len(categories)
+        if time_windows:
+            # Blockweise, damit Zwischen-Arrays höchstens stream_block_size groß sind
+            n_cells = len(time_windows) * n_categories
+            block_size = self.config.stream_block_size or len(timestamps)
+            count_rows = np.zeros(n_cells, dtype=np.int64)
+            for lo in range(0, len(timestamps), block_size):
+                window_idx = self._assign_windows(timestamps[lo:lo + block_size], time_windows)
+                block_categories = markers["category"][lo:lo + block_size]
+                inside = window_idx >= 0
+                cell_idx = window_idx[inside] * n_categories + block_categories[inside]
+                count_rows += np.bincount(cell_idx, minlength=n_cells)
+            count_rows = count_rows.reshape(len(time_windows), n_categories)
+        else:
+            count_rows = np.zeros((0, n_categories), dtype=np.int64)
+        
         # Aggregiere Marker-Counts gesamt
         total_points = []
-        category_series = defaultdict(list)
+        category_points = [[] for _ in categories]
         
-        for window_start, window_end in time_windows:
-            window_matches = [
-                m for m in sorted_matches
-                if window_start <= m.timestamp < window_end
-            ]
+        for (window_start, window_end), row in zip(time_windows, count_rows):
+            window_total = int(row.sum())
             
             # Gesamt-Counts
             total_point = TimeSeriesPoint(
                 timestamp=window_start,
                 period_start=window_start,
                 period_end=window_end,
-                values={"marker_count": len(window_matches)},
-                counts={"total": len(window_matches)}
+                values={"marker_count": window_total},
+                counts={"total": window_total}
             )
             
             # Counts nach Kategorie
-            category_counts = defaultdict(int)
-            for match in window_matches:
-                category_counts[match.category.value] += 1
-            
-            total_point.counts.update(category_counts)
+            total_point.counts.update(
+                {category: int(count) for category, count in zip(categories, row) if count}
+            )
             total_points.append(total_point)
             
             # Separate Serien pro Kategorie
-            for category in MarkerCategory:
-                cat_count = category_counts.get(category.value, 0)
+            for code, count in enumerate(row):
+                cat_count = int(count)
                 cat_point = TimeSeriesPoint(
                     timestamp=window_start,
                     period_start=window_start,
                     period_end=window_end,
                     values={"count": cat_count},
-                    counts={category.value: cat_count}
+                    counts={categories[code]: cat_count}
                 )
-                category_series[category.value].append(cat_point)
+                category_points[code].append(cat_point)
         
         # Erstelle Gesamt-Serie
         series_dict["markers_total"] = TimeSeriesData(
@@ -217,7 +391,9 @@ class TimeSeriesAggregator:
         )
         
         # Erstelle Kategorie-Serien
-        for category, points in category_series.items():
+        for category, points in zip(categories, category_points):
+            if not points:
+                continue
             series_dict[f"markers_{category}"] = TimeSeriesData(
                 series_id=f"markers_{category}",
                 name=f"{category.replace('_', ' ').title()} Markers",
@@ -229,75 +405,133 @@ class TimeSeriesAggregator:
         
         return series_dict
     
+    @staticmethod
+    def _assign_windows(
+        timestamps: pd.DatetimeIndex,
+        windows: List[Tuple[datetime, datetime]]
+    ) -> np.ndarray:
+        """Ordnet jedem Zeitstempel den Index seines Zeitfensters zu (-1 = außerhalb)."""
+        window_starts = pd.DatetimeIndex([w[0] for w in windows])
+        window_idx = np.searchsorted(window_starts, timestamps, side='right') - 1
+        window_idx[timestamps >= windows[-1][1]] = -1
+        return window_idx
+    
+    @staticmethod
+    def _window_offsets(
+        timestamps: pd.DatetimeIndex,
+        windows: List[Tuple[datetime, datetime]]
+    ) -> np.ndarray:
+        """Slice-Offsets der Zeitfenster in sortierten Zeitstempeln (Länge W+1)."""
+        edges = pd.DatetimeIndex([w[0] for w in windows] + [windows[-1][1]])
+        return np.searchsorted(timestamps, edges, side='left')
+    
+    @staticmethod
+    def _reduce_windows(
+        values: np.ndarray,
+        confidences: np.ndarray,
+        offsets: np.ndarray
+    ) -> List[Optional[Dict[str, float]]]:
+        """Berechnet Fenster-Statistiken per reduceat über sortierte Werte (None = leeres Fenster)."""
+        if not len(values):
+            return [None] * (len(offsets) - 1)
+        
+        counts = np.diff(offsets)
+        safe_counts = np.maximum(counts, 1)
+        # reduceat verlangt gültige Startindizes; leere Fenster werden unten verworfen
+        starts = np.minimum(offsets[:-1], len(values) - 1)
+        
+        means = np.add.reduceat(values, starts) / safe_counts
+        # Fenster decken alle Werte ab: Abweichung je Wert vom Mittel seines Fensters
+        deviations = values - np.repeat(means, counts)
+        stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / safe_counts)
+        mins = np.minimum.reduceat(values, starts)
+        maxs = np.maximum.reduceat(values, starts)
+        confidence_avgs = np.add.reduceat(confidences, starts) / safe_counts
+        
+        window_stats = []
+        for i, count in enumerate(counts):
+            if count == 0:
+                window_stats.append(None)
+                continue
+            window_stats.append({
+                "mean": means[i],
+                "min": mins[i],
+                "max": maxs[i],
+                "std": stds[i],
+                "median": np.median(values[offsets[i]:offsets[i + 1]]),
+                "count": int(count),
+                "confidence_avg": confidence_avgs[i]
+            })
+        
+        return window_stats
+    
+    def _reduce_windows_blocked(
+        self,
+        values: np.ndarray,
+        confidences: np.ndarray,
+        offsets: np.ndarray
+    ) -> List[Optional[Dict[str, float]]]:
+        """Wie _reduce_windows, aber in Blöcken von ca. stream_block_size Werten."""
+        block_size = self.config.stream_block_size
+        if not block_size or len(values) <= block_size:
+            return self._reduce_windows(values, confidences, offsets)
+        
+        # Blockgrenzen auf Fenstergrenzen legen: jedes Fenster (inkl. Median)
+        # liegt vollständig in einem Block, es muss nichts gemergt werden
+        n_windows = len(offsets) - 1
+        cuts = np.unique(np.searchsorted(
+            offsets, np.arange(block_size, len(values), block_size), side='left'
+        ))
+        bounds = [0, *cuts[cuts < n_windows].tolist(), n_windows]
+        
+        window_stats = []
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            lo, hi = offsets[first], offsets[last]
+            window_stats.extend(self._reduce_windows(
+                values[lo:hi],
+                confidences[lo:hi],
+                offsets[first:last + 1] - lo
+            ))
+        return window_stats
+    
     def _create_time_windows(
         self,
         start: datetime,
         end: datetime,
         period: AggregationPeriod
     ) -> List[Tuple[datetime, datetime]]:
-        """Erstellt Zeitfenster für Aggregation."""
-        windows = []
-        current = start
-        
-        while current < end:
-            if period == AggregationPeriod.HOURLY:
-                window_end = current + timedelta(hours=1)
-            elif period == AggregationPeriod.DAILY:
-                window_end = current + timedelta(days=1)
-            elif period == AggregationPeriod.WEEKLY:
-                window_end = current + timedelta(weeks=1)
-            elif period == AggregationPeriod.MONTHLY:
-                # Nächster Monat
-                if current.month == 12:
-                    window_end = current.replace(year=current.year + 1, month=1)
-                else:
-                    window_end = current.replace(month=current.month + 1)
-            elif period == AggregationPeriod.QUARTERLY:
-                # Nächstes Quartal
-                quarter = (current.month - 1) // 3
-                if quarter == 3:
-                    window_end = current.replace(year=current.year + 1, month=1)
-                else:
-                    window_end = current.replace(month=(quarter + 1) * 3 + 1)
-            elif period == AggregationPeriod.YEARLY:
-                window_end = current.replace(year=current.year + 1)
-            elif period == AggregationPeriod.CUSTOM:
-                hours = self.config.custom_period_hours or 24
-                window_end = current + timedelta(hours=hours)
-            else:
-                window_end = current + timedelta(days=1)
-            
-            windows.append((current, window_end))
-            current = window_end
-        
-        return windows
+        """Erstellt kalender-ausgerichtete Zeitfenster, die [start, end] abdecken."""
+        if period == AggregationPeriod.CUSTOM:
+            freq = f"{self.config.custom_period_hours or 24}h"
+        else:
+            freq = FREQ_MAP.get(period, "D")
+        return list(_time_windows(start, end, freq, str(start.tzinfo)))
     
     def _create_score_point(
         self,
-        scores: List[ChunkScore],
+        stats: Optional[Dict[str, float]],
         start: datetime,
         end: datetime,
         score_type: str
     ) -> TimeSeriesPoint:
-        """Erstellt einen aggregierten Score-Punkt."""
+        """Erstellt einen aggregierten Score-Punkt aus den Fenster-Statistiken."""
         point = TimeSeriesPoint(
             timestamp=start,
             period_start=start,
             period_end=end
         )
         
-        if scores:
-            values = [s.normalized_score for s in scores]
+        if stats is not None:
             point.values = {
-                "mean": np.mean(values),
-                "min": min(values),
-                "max": max(values),
-                "std": np.std(values) if len(values) > 1 else 0,
-                "median": np.median(values)
+                "mean": stats["mean"],
+                "min": stats["min"],
+                "max": stats["max"],
+                "std": stats["std"] if stats["count"] > 1 else 0,
+                "median": stats["median"]
             }
             point.counts = {
-                "chunk_count": len(scores),
-                "confidence_avg": np.mean([s.confidence for s in scores])
+                "chunk_count": int(stats["count"]),
+                "confidence_avg": stats["confidence_avg"]
             }
         else:
             # Keine Daten für diesen Zeitraum
@@ -322,17 +556,17 @@ class TimeSeriesAggregator:
             return points
         
         # Extrahiere Werte
-        values = [p.values.get("mean", 0) for p in points]
-        
-        # Berechne Moving Average
-        smoothed = []
-        window = self.config.smoothing_window
+        values = np.fromiter(
+            (p.values.get("mean", 0) for p in points),
+            dtype=np.float64, count=len(points)
+        )
         
-        for i in range(len(values)):
-            start_idx = max(0, i - window // 2)
-            end_idx = min(len(values), i + window // 2 + 1)
-            window_values = values[start_idx:end_idx]
-            smoothed.append(np.mean(window_values))
+        # Zentrierter Moving Average als Faltung; an den Rändern wird nur
+        # über die vorhandenen Werte gemittelt
+        kernel = np.ones(2 * (self.config.smoothing_window // 2) + 1)
+        sums = np.convolve(values, kernel, mode='same')
+        counts = np.convolve(np.ones(len(values)), kernel, mode='same')
+        smoothed = sums / counts
         
         # Update Points
         for i, point in enumerate(points):
@@ -342,8 +576,8 @@ class TimeSeriesAggregator:
     
     def _create_heatmaps(
         self,
-        chunk_scores: List[ChunkScore],
-        marker_matches: List[MarkerMatch],
+        scores: Dict[str, np.ndarray],
+        markers: Dict[str, np.ndarray],
         period: AggregationPeriod
     ) -> Dict[str, HeatmapData]:
         """Erstellt Heatmap-Daten."""
@@ -351,7 +585,7 @@ class TimeSeriesAggregator:
         
         # Marker-Kategorie Heatmap über Zeit
         category_heatmap = self._create_category_timeline_heatmap(
-            marker_matches,
+            markers,
             period
         )
         if category_heatmap:
@@ -359,7 +593,7 @@ class TimeSeriesAggregator:
         
         # Score-Vergleich Heatmap
         score_heatmap = self._create_score_comparison_heatmap(
-            chunk_scores,
+            scores,
             period
         )
         if score_heatmap:
@@ -369,82 +603,63 @@ class TimeSeriesAggregator:
     
     def _create_category_timeline_heatmap(
         self,
-        matches: List[MarkerMatch],
+        markers: Dict[str, np.ndarray],
         period: AggregationPeriod
     ) -> Optional[HeatmapData]:
         """Erstellt Heatmap für Marker-Kategorien über Zeit."""
-        timed_matches = [m for m in matches if m.timestamp]
-        if not timed_matches:
+        if not len(markers["timestamp"]):
             return None
         
+        timestamps = pd.DatetimeIndex(markers["timestamp"])
+        
         # Zeitfenster
-        start = min(m.timestamp for m in timed_matches)
-        end = max(m.timestamp for m in timed_matches)
+        start = timestamps[0].to_pydatetime()
+        end = timestamps[-1].to_pydatetime()
         windows = self._create_time_windows(start, end, period)
         
-        # Matrix aufbauen
-        categories = list(MarkerCategory)
-        matrix = []
-        x_labels = []
+        # Matrix (Kategorien x Fenster) in einem Durchgang aufbauen
+        cat_idx = markers["category"]
+        win_idx = self._assign_windows(timestamps, windows)
+        inside = win_idx >= 0
+        matrix = np.zeros((len(CAT_FROM_CODE), len(windows)), dtype=np.int64)
+        np.add.at(matrix, (cat_idx[inside], win_idx[inside]), 1)
         
-        for window_start, window_end in windows:
-            window_matches = [
-                m for m in timed_matches
-                if window_start <= m.timestamp < window_end
-            ]
-            
-            # Zähle pro Kategorie
-            row = []
-            for category in categories:
-                count = sum(1 for m in window_matches if m.category == category)
-                row.append(count)
-            
-            matrix.append(row)
-            x_labels.append(window_start.strftime("%Y-%m-%d %H:%M"))
-        
-        # Transponiere für bessere Darstellung
-        matrix = list(map(list, zip(*matrix)))
+        x_labels = [window_start.strftime("%Y-%m-%d %H:%M") for window_start, _ in windows]
         
         return HeatmapData(
             title="Marker Categories Over Time",
             x_labels=x_labels,
-            y_labels=[cat.value for cat in categories],
-            values=matrix,
+            y_labels=[cat.value for cat in CAT_FROM_CODE],
+            values=matrix.tolist(),
             color_scale="YlOrRd"
         )
     
     def _create_score_comparison_heatmap(
         self,
-        chunk_scores: List[ChunkScore],
+        scores: Dict[str, np.ndarray],
         period: AggregationPeriod
     ) -> Optional[HeatmapData]:
         """Erstellt Heatmap für Score-Vergleiche."""
-        if not chunk_scores:
+        if not len(scores["timestamp"]):
             return None
         
-        # Gruppiere nach Score-Typ und Speaker
-        score_matrix = defaultdict(lambda: defaultdict(list))
-        
-        for score in chunk_scores:
-            if score.timestamp:
-                speaker = score.metadata.get("speaker", "Unknown")
-                score_matrix[score.score_type.value][speaker].append(score.normalized_score)
-        
-        if not score_matrix:
-            return None
-        
-        # Erstelle Matrix
-        score_types = list(score_matrix.keys())
-        speakers = list(set(speaker for scores in score_matrix.values() for speaker in scores))
+        # Mittelwert pro (Score-Typ, Speaker) in einem groupby
+        df = pd.DataFrame({
+            'type': scores["type"],
+            'speaker': scores["speaker"],
+            'score': scores["score"],
+        })
+        # Speaker in Reihenfolge ihres ersten Auftretens, Typen in Code-Reihenfolge
+        speakers = list(dict.fromkeys(scores["speaker"]))
+        pivot = (
+            df.groupby(['type', 'speaker'], sort=False)['score'].mean()
+            .unstack(fill_value=0)
+            .reindex(columns=speakers, fill_value=0)
+            .sort_index()
+        )
         
-        matrix = []
-        for score_type in score_types:
-            row = []
-            for speaker in speakers:
-                scores = score_matrix[score_type].get(speaker, [])
-                avg_score = np.mean(scores) if scores else 0
-                row.append(avg_score)
-            matrix.append(row)
+        score_types = [SCORE_FROM_CODE[code].value for code in pivot.index]
+        matrix = pivot.to_numpy().tolist()
         
         return HeatmapData(
             title="Average Scores by Type and Speaker",
@@ -488,24 +703,27 @@ class TimeSeriesAggregator:
     ) -> List[List[float]]:
         """Berechnet Korrelationsmatrix zwischen Zeitreihen."""
         # Extrahiere Werte
-        value_arrays = []
-        for series in series_list:
-            values = [p.values.get("mean", 0) for p in series.data_points]
-            value_arrays.append(values)
+        value_arrays = [
+            np.fromiter(
+                (p.values.get("mean", 0) for p in series.data_points),
+                dtype=np.float64, count=len(series.data_points)
+            )
+            for series in series_list
+        ]
         
-        # Berechne Korrelationen
+        # Nur gleich lange Serien sind vergleichbar: ein corrcoef pro Länge
         n = len(value_arrays)
-        corr_matrix = [[0.0] * n for _ in range(n)]
+        corr_matrix = np.zeros((n, n))
+        indices_by_length = defaultdict(list)
+        for i, values in enumerate(value_arrays):
+            indices_by_length[len(values)].append(i)
         
-        for i in range(n):
-            for j in range(n):
-                if len(value_arrays[i]) == len(value_arrays[j]):
-                    corr = np.corrcoef(value_arrays[i], value_arrays[j])[0, 1]
-                    corr_matrix[i][j] = float(corr) if not np.isnan(corr) else 0.0
-                else:
-                    corr_matrix[i][j] = 0.0
+        for indices in indices_by_length.values():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                block = np.corrcoef(np.vstack([value_arrays[i] for i in indices]))
+            corr_matrix[np.ix_(indices, indices)] = np.atleast_2d(block)
         
-        return corr_matrix
+        return np.nan_to_num(corr_matrix, nan=0.0).tolist()
     
     def _calculate_series_statistics(
         self,
@@ -518,26 +736,35 @@ class TimeSeriesAggregator:
         
         # Extrahiere Hauptmetrik
         if main_metric in ["marker_count", "count"]:
-            values = [p.values.get(main_metric, p.values.get("count", 0)) for p in points]
+            values = np.fromiter(
+                (p.values.get(main_metric, p.values.get("count", 0)) for p in points),
+                dtype=np.float64, count=len(points)
+            )
         else:
-            values = [p.values.get("mean", 0) for p in points]
+            values = np.fromiter(
+                (p.values.get("mean", 0) for p in points),
+                dtype=np.float64, count=len(points)
+            )
         
-        non_zero_values = [v for v in values if v > 0]
+        # Alle Kennzahlen auf einem Array statt mehrerer Listen-Durchläufe
+        n = values.size
+        total = values.sum()
+        average = total / n
         
         stats = {
-            "total_periods": len(points),
-            "non_zero_periods": len(non_zero_values),
-            "average": np.mean(values) if values else 0,
-            "std_dev": np.std(values) if len(values) > 1 else 0,
-            "min": min(values) if values else 0,
-            "max": max(values) if values else 0,
-            "sum": sum(values) if values else 0
+            "total_periods": n,
+            "non_zero_periods": int(np.count_nonzero(values > 0)),
+            "average": float(average),
+            "std_dev": float(np.sqrt(np.square(values - average).sum() / n)) if n > 1 else 0,
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "sum": float(total)
         }
         
         # Trend
-        if len(values) > 2:
-            first_third = np.mean(values[:len(values)//3])
-            last_third = np.mean(values[-len(values)//3:])
+        if n > 2:
+            first_third = values[:n // 3].mean()
+            last_third = values[-n // 3:].mean()
             if last_third > first_third * 1.1:
                 stats["trend"] = "increasing"
             elif last_third < first_third * 0.9:
@@ -573,47 +800,32 @@ class TimeSeriesAggregator:
         if not time_series:
             return pd.DataFrame()
         
-        # Sammle alle Datenpunkte
-        all_data = []
+        # Ein breiter Frame pro Serie, ausgerichtet über den Timestamp-Index
+        frames = []
         
         for series_name, series in time_series.items():
-            for point in series.data_points:
-                row = {
-                    'timestamp': point.timestamp,
-                    'period_start': point.period_start,
-                    'period_end': point.period_end,
-                    'series': series_name,
-                    'metric_type': series.metric_type
-                }
-                
-                # Füge Werte hinzu
-                for key, value in point.values.items():
-                    row[f"{series_name}_{key}"] = value
-                
-                # Füge Counts hinzu
-                for key, count in point.counts.items():
-                    row[f"{series_name}_{key}_count"] = count
-                
-                all_data.append(row)
-        
-        df = pd.DataFrame(all_data)
-        
-        # Pivotiere für bessere Darstellung
-        if not df.empty:
-            # Gruppiere nach Timestamp
-            pivot_data = {}
-            for _, row in df.iterrows():
-                ts = row['timestamp']
-                if ts not in pivot_data:
-                    pivot_data[ts] = {'timestamp': ts}
-                
-                # Kopiere relevante Werte
-                for col in row.index:
-                    if col not in ['timestamp', 'period_start', 'period_end', 'series', 'metric_type']:
-                        pivot_data[ts][col] = row[col]
+            points = series.data_points
+            if not points:
+                continue
+            
+            value_keys = dict.fromkeys(key for p in points for key in p.values)
+            count_keys = dict.fromkeys(key for p in points for key in p.counts)
+            
+            columns = {
+                f"{series_name}_{key}": [p.values.get(key) for p in points]
+                for key in value_keys
+            }
+            columns.update({
+                f"{series_name}_{key}_count": [p.counts.get(key) for p in points]
+                for key in count_keys
+            })
             
-            df = pd.DataFrame(list(pivot_data.values()))
-            df.set_index('timestamp', inplace=True)
-            df.sort_index(inplace=True)
+            frames.append(pd.DataFrame(
+                columns,
+                index=pd.DatetimeIndex([p.timestamp for p in points], name='timestamp')
+            ))
+        
+        if not frames:
+            return pd.DataFrame()
         
-        return df
\ No newline at end of file
+        return pd.concat(frames, axis=1).sort_index()
@@ -1,8 +1,9 @@
 """Datenmodelle für Text-Chunks."""
 
 from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, root_validator, validator
 from enum import Enum
 
 
@@ -50,19 +51,15 @@ class TextChunk(BaseModel):
     previous_chunk_id: Optional[str] = Field(None, description="ID des vorherigen Chunks")
     next_chunk_id: Optional[str] = Field(None, description="ID des nächsten Chunks")
     
-    @validator('word_count', always=True)
-    def calculate_word_count(cls, v, values):
-        """Berechnet Wortanzahl wenn nicht gesetzt."""
-        if v == 0 and 'text' in values:
-            return len(values['text'].split())
-        return v
-    
-    @validator('char_count', always=True)
-    def calculate_char_count(cls, v, values):
-        """Berechnet Zeichenanzahl wenn nicht gesetzt."""
-        if v == 0 and 'text' in values:
-            return len(values['text'])
-        return v
+    @root_validator(skip_on_failure=True)
+    def calculate_counts(cls, values):
+        """Berechnet Wort- und Zeichenanzahl nur wenn nicht gesetzt."""
+        text = values.get('text', '')
+        if not values.get('char_count'):
+            values['char_count'] = len(text)
+        if not values.get('word_count'):
+            values['word_count'] = len(text.split())
+        return values
     
     def get_context(self, words_before: int = 5, words_after: int = 5) -> str:
         """Gibt Kontext um eine Position im Chunk zurück."""
@@ -70,6 +67,48 @@ class TextChunk(BaseModel):
         return ' '.join(words[:words_before + words_after + 1])
 
 
+@dataclass(slots=True)
+class TextChunkLite:
+    """Schlanke TextChunk-Variante ohne Validierung für große Chunk-Listen.
+    
+    Gleiche Attribute wie TextChunk, aber mit __slots__ statt __dict__;
+    kann überall genutzt werden, wo nur Attribute gelesen werden.
+    """
+    
+    id: str
+    type: ChunkType
+    text: str
+    start_pos: int
+    end_pos: int
+    word_count: int = 0
+    char_count: int = 0
+    original_text: Optional[str] = None
+    speaker: Optional[Speaker] = None
+    timestamp: Optional[datetime] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    previous_chunk_id: Optional[str] = None
+    next_chunk_id: Optional[str] = None
+    
+    @classmethod
+    def from_chunk(cls, chunk: TextChunk) -> "TextChunkLite":
+        """Übernimmt die Felder eines validierten TextChunk."""
+        return cls(
+            id=chunk.id,
+            type=chunk.type,
+            text=chunk.text,
+            start_pos=chunk.start_pos,
+            end_pos=chunk.end_pos,
+            word_count=chunk.word_count,
+            char_count=chunk.char_count,
+            original_text=chunk.original_text,
+            speaker=chunk.speaker,
+            timestamp=chunk.timestamp,
+            metadata=chunk.metadata,
+            previous_chunk_id=chunk.previous_chunk_id,
+            next_chunk_id=chunk.next_chunk_id
+        )
+
+
 class ChunkingConfig(BaseModel):
     """Konfiguration für das Text-Chunking."""
     
@@ -157,6 +196,10 @@ class ChunkingResult(BaseModel):
             return len(values['chunks'])
         return v
     
+    def to_lite_chunks(self) -> List[TextChunkLite]:
+        """Gibt die Chunks als speichersparende TextChunkLite-Liste zurück."""
+        return [TextChunkLite.from_chunk(c) for c in self.chunks]
+    
     def get_chunks_by_speaker(self, speaker_id: str) -> List[TextChunk]:
         """Gibt alle Chunks eines Sprechers zurück."""
         return [c for c in self.chunks if c.speaker and c.speaker.id == speaker_id]
@@ -1,8 +1,15 @@
 from fastapi import FastAPI, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne
 import yaml, datetime
 
+# libyaml-Parser wenn verfügbar, sonst reiner Python-Loader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 app = FastAPI()
 
 # ➡️ MongoDB-Zugangsdaten HIER eintragen (ersetze die Platzhalter!):
@@ -26,17 +33,32 @@ def upload_form():
     </html>
     """
 
-@app.post("/upload/", response_class=HTMLResponse)
-async def upload_file(file: UploadFile = File(...)):
-    content = await file.read()
-    data = yaml.safe_load(content)
+def _ingest(content, filename):
+    data = yaml.load(content, Loader=_Loader)
     items = data if isinstance(data, list) else [data]
-    imported, failed = [], []
+    imported, failed, ops = [], [], {}
+    now = datetime.datetime.utcnow().isoformat()
     for m in items:
         if valid_marker(m):
-            m["_audit"] = {"ts": datetime.datetime.utcnow().isoformat(), "src": file.filename}
-            db.replace_one({"id": m["id"]}, m, upsert=True)
+            m["_audit"] = {"ts": now, "src": filename}
+            # Pro id nur der letzte Upsert: ungeordnete Bulk-Writes garantieren keine Reihenfolge
+            op = ReplaceOne({"id": m["id"]}, m, upsert=True)
+            try:
+                ops[m["id"]] = op
+            except TypeError:
+                # Nicht hashbare id (Liste/Mapping): ohne Dedupe übernehmen
+                ops[object()] = op
             imported.append(m["id"])
         else:
             failed.append(m.get("id", "?"))
+    # Alle Upserts in einem Roundtrip
+    if ops:
+        db.bulk_write(list(ops.values()), ordered=False)
+    return imported, failed
+
+@app.post("/upload/", response_class=HTMLResponse)
+async def upload_file(file: UploadFile = File(...)):
+    content = await file.read()
+    # YAML-Parsing und Mongo-I/O blockieren sonst den Event-Loop
+    imported, failed = await run_in_threadpool(_ingest, content, file.filename)
     return f"<b>Importiert:</b> {imported}<br><b>Fehlerhaft:</b> {failed}"
\ No newline at end of file
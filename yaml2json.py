@@ -11,88 +11,537 @@ einzelne Datei in gleichnamige .json-Dateien um.
 Optionen:
     --out DIR        Zielordner (default: <eingabepfad>/json_out)
     --schema FILE    JSON-Schema zur Validierung (optional)
-    --indent N       Einrückung im Output-JSON (default: 2)
+    --indent N       Einrückung im Output-JSON (default: 0 = kompakt, ≤ 0 ohne Leerzeichen)
+    --quiet          Nur Fehler und Zusammenfassung ausgeben
+    --jsonl FILE     Alle Dokumente als JSON Lines in eine Datei statt .json pro Datei
+    --require-key KEY[=VALUE]
+                     Nur Dateien mit diesem Top-Level-Schlüssel (Punkte für
+                     verschachtelte Schlüssel, z.B. __pipeline__.name) umwandeln
+    --force          Auch Dateien umwandeln, deren .json neuer als die .yaml ist
 """
 
-import argparse, json, sys
+import argparse, hashlib, json, math, mmap, os, queue, sys, threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 try:
-    from ruamel.yaml import YAML
+    import yaml as pyyaml
+    from yaml import CSafeLoader  # nur vorhanden, wenn PyYAML mit libyaml gebaut ist
+except ImportError:
+    pyyaml = CSafeLoader = None
+
+if CSafeLoader is None:
+    try:
+        from ruamel.yaml import YAML
+    except ModuleNotFoundError:
+        sys.exit("❌  PyYAML (libyaml) oder ruamel.yaml fehlt:  pip install pyyaml")
+    # typ="safe" liefert reine dict/list (kein CommentedMap); preserve_quotes
+    # wirkt nur im Round-Trip-Modus und bleibt daher aus
+    yaml = YAML(typ="safe", pure=False)
+
+try:
+    import fastjsonschema
 except ModuleNotFoundError:
-    sys.exit("❌  ruamel.yaml fehlt:  pip install ruamel.yaml")
+    fastjsonschema = None  # Fallback: jsonschema
 
 try:
     import jsonschema
 except ModuleNotFoundError:
     jsonschema = None  # Validierung nur, wenn verfügbar
 
-yaml = YAML(typ="safe")
-yaml.preserve_quotes = True   # kein Verlust bei Strings
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # Fallback: stdlib json
+
+try:
+    import xxhash
+except ModuleNotFoundError:
+    xxhash = None  # Fallback: hashlib.blake2b
+
+MMAP_MIN_SIZE = 64 * 1024  # ab dieser Größe liest libyaml direkt aus dem mmap
 
-def load_yaml(path: Path):
-    """Liest alle YAML-Dokumente (---) aus einer Datei."""
-    with path.open("r", encoding="utf-8") as f:
-        return list(yaml.load_all(f))
+@contextmanager
+def open_source(path: Path, prefetched=None):
+    """Rohe Bytes einer Datei; große Dateien als mmap statt Kopie."""
+    if prefetched is not None:
+        yield prefetched  # schon vom Reader-Thread gelesen
+        return
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
 
-def validate(obj, schema):
-    """Optional: JSON-Schema-Validierung."""
+def content_hash(raw) -> bytes:
+    """Schneller Inhalts-Hash der YAML-Rohdaten (Schlüssel für den Dedupe-Cache)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(raw)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+# Loader einmal beim Import wählen statt Verzweigung pro Datei
+if CSafeLoader is not None:
+    # libyaml dekodiert UTF-8 selbst in C, direkt aus bytes bzw. mmap
+    _load_all = partial(pyyaml.load_all, Loader=CSafeLoader)
+    _load_one = partial(pyyaml.load, Loader=CSafeLoader)
+else:
+    def _load_all(raw):
+        return yaml.load_all(bytes(raw).decode("utf-8"))
+
+    def _load_one(raw):
+        return yaml.load(bytes(raw).decode("utf-8"))
+
+def load_yaml(raw):
+    """Liest alle YAML-Dokumente (---) aus den Rohdaten einer Datei."""
+    return list(_load_all(raw))
+
+def build_validator(schema):
+    """Prüft das Schema einmal und gibt die Validierungsfunktion zurück."""
+    if fastjsonschema is not None:
+        # Generiert eine auf das Schema spezialisierte Python-Funktion
+        return fastjsonschema.compile(schema)
     if jsonschema is None:
         raise RuntimeError("jsonschema nicht installiert")
-    jsonschema.validate(obj, schema)
-
-def convert_file(path: Path, out_dir: Path, schema, indent: int):
-    docs = load_yaml(path)
-    # Datei kann mehrere YAML-Dokumente enthalten → Liste serialisieren
-    out_data = docs[0] if len(docs) == 1 else docs
-    if schema:
-        validate(out_data, schema)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema).validate
+
+_validate_fn = None  # kompilierter Validator je Prozess (nicht picklebar)
+
+def _init_worker(schema):
+    """Pool-Initializer: kompiliert den Validator einmal pro Prozess.
+
+    Das Schema wird so nur einmal je Worker übertragen statt mit jedem Job.
+    """
+    global _validate_fn
+    _validate_fn = build_validator(schema) if schema else None
+
+HEAD_BYTES = 4096  # --require-key: nur so viel wird vorab gelesen
+
+class SkipFile(Exception):
+    """Datei erfüllt --require-key nicht und wird übersprungen."""
+
+def parse_require(spec):
+    """'a.b=wert' → (('a', 'b'), 'wert'); ohne '=' ist der Wert None."""
+    key, sep, value = spec.partition("=")
+    return tuple(key.split(".")), (value if sep else None)
+
+def head_has_key(path: Path, parts) -> bool:
+    """Vorfilter: stehen alle Schlüsselteile als 'KEY:' in den ersten 4 KiB?
+
+    Nicht lesbare Dateien bleiben drin, damit der Worker den Fehler meldet.
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(HEAD_BYTES)
+    except OSError:
+        return True
+    return all(part.encode("utf-8") + b":" in head for part in parts)
+
+def has_key(data, parts, value) -> bool:
+    """Prüft den geparsten Inhalt exakt (bei mehreren Dokumenten: irgendeins)."""
+    if isinstance(data, list):
+        return any(has_key(doc, parts, value) for doc in data)
+    for part in parts:
+        if not isinstance(data, dict) or part not in data:
+            return False
+        data = data[part]
+    return value is None or str(data) == value
+
+def load_document(raw, validate_fn, require=None):
+    """Lädt YAML-Rohdaten als ein JSON-Objekt und validiert es optional."""
+    out_data = None
+    if raw.find(b"\n---") == -1:
+        # Kein weiterer Dokument-Trenner → ein Dokument, ohne Generator und Liste
+        out_data = _load_one(raw)
+    if out_data is None:
+        if isinstance(raw, mmap.mmap):
+            raw.seek(0)  # der Fast Path hat das mmap schon bis zum Ende gelesen
+        # Mehrere YAML-Dokumente → Liste serialisieren (leere Datei bleibt [])
+        docs = load_yaml(raw)
+        out_data = docs[0] if len(docs) == 1 else docs
+    if require and not has_key(out_data, *require):
+        raise SkipFile()
+    if validate_fn:
+        validate_fn(out_data)
+    return out_data
+
+DEDUPE_MAX_BYTES = 64 * 1024 * 1024  # Obergrenze des Dedupe-Caches je Prozess
+
+_dedupe_cache = {}  # (Inhalts-Hash, Format) → fertige JSON-Bytes, je Prozess
+_dedupe_size = 0
+
+def _remember(key, data: bytes):
+    """Legt fertiges JSON für identische Vorlagen-Dateien ab (bis zur Obergrenze)."""
+    global _dedupe_size
+    if _dedupe_size + len(data) <= DEDUPE_MAX_BYTES:
+        _dedupe_cache[key] = data
+        _dedupe_size += len(data)
+
+def _has_nonfinite(obj) -> bool:
+    """Enthält obj irgendwo NaN oder ±Infinity?"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+def _with_stdlib_fallback(fast, slow):
+    """orjson-Dumper, der für orjson-Sonderfälle auf stdlib json zurückfällt.
+
+    orjson lehnt Integer über 64 Bit ab und schreibt NaN/Infinity still als
+    null; json.dumps schreibt beides wie bisher. Der NaN-Scan läuft nur, wenn
+    die Ausgabe überhaupt ein null enthält.
+    """
+    def dump(obj):
+        try:
+            data = fast(obj)
+        except orjson.JSONEncodeError:
+            return slow(obj)
+        if b"null" in data and _has_nonfinite(obj):
+            return slow(obj)
+        return data
+    return dump
+
+def _json_default(obj):
+    """YAML-Datumswerte (unquotiertes 2025-07-13) wie orjson als ISO-8601-String."""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@lru_cache(maxsize=None)
+def make_dumper(indent, jsonl: bool = False):
+    """Serialisierung obj → UTF-8-Bytes, einmal pro Prozess auf die Optionen spezialisiert."""
+    if jsonl or indent <= 0:
+        # Kompakt ohne Leerzeichen, wie orjson
+        encode = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=_json_default
+        ).encode
+    else:
+        # Ein encode + write_bytes statt TextIOWrapper mit inkrementellem Encoder
+        encode = json.JSONEncoder(ensure_ascii=False, indent=indent, default=_json_default).encode
+    end = "\n" if jsonl else ""
+    slow = lambda obj: (encode(obj) + end).encode("utf-8")
+    if orjson is None or not (jsonl or indent <= 0 or indent == 2):
+        return slow
+    # orjson schreibt UTF-8-Bytes direkt (wie ensure_ascii=False); indent ≤ 0 → kompakt
+    option = orjson.OPT_NON_STR_KEYS
+    if jsonl:
+        option |= orjson.OPT_APPEND_NEWLINE
+    elif indent > 0:
+        option |= orjson.OPT_INDENT_2
+    return _with_stdlib_fallback(partial(orjson.dumps, option=option), slow)
+
+def is_up_to_date(path: Path, out_path: Path) -> bool:
+    """True, wenn das JSON existiert und nicht älter als die YAML-Quelle ist."""
+    try:
+        return out_path.stat().st_mtime_ns >= path.stat().st_mtime_ns
+    except OSError:
+        return False  # fehlt oder nicht lesbar → umwandeln, Fehler meldet der Worker
+
+_claimed = set()  # in diesem Lauf geschriebene bzw. als aktuell bestätigte Ausgaben
+
+def convert_file(path: Path, out_dir: Path, indent: int, dump_fn, validate_fn,
+                 require=None, incremental=False, prefetched=None):
+    out_path = out_dir / (path.stem + ".json")
+    if incremental and is_up_to_date(path, out_path):
+        _claimed.add(out_path)
+        return out_path  # nur ein stat statt Parse + Encode
+    with open_source(path, prefetched) as raw:
+        key = (content_hash(raw), indent)
+        data = _dedupe_cache.get(key)
+        if data is None:
+            out_data = load_document(raw, validate_fn, require)
+    if data is None:
+        data = dump_fn(out_data)
+        _remember(key, data)
+    # Identische Datei schon umgewandelt → kein Parse, kein Encode, nur schreiben
+    out_path.write_bytes(data)
+    _claimed.add(out_path)
+    return out_path
+
+def discard_stale_output(path: Path, out_dir: Path):
+    """Entfernt die alte .json einer fehlgeschlagenen Datei.
+
+    Sonst gälte sie beim nächsten Lauf als aktuell und der Fehler bliebe
+    unsichtbar. Ausgaben, die in diesem Lauf eine andere Datei gleichen
+    Namens geschrieben hat, bleiben stehen.
+    """
     out_path = out_dir / (path.stem + ".json")
-    out_path.write_text(
-        json.dumps(out_data, ensure_ascii=False, indent=indent),
-        encoding="utf-8"
-    )
-    print(f"✔  {path.name}  →  {out_path.relative_to(out_dir.parent)}")
+    if out_path not in _claimed:
+        try:
+            out_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def convert_line(path: Path, dump_fn, validate_fn, require=None, prefetched=None) -> bytes:
+    """Konvertiert eine Datei in eine kompakte JSON-Zeile (JSON Lines)."""
+    with open_source(path, prefetched) as raw:
+        key = (content_hash(raw), "jsonl")
+        line = _dedupe_cache.get(key)
+        if line is not None:
+            return line
+        out_data = load_document(raw, validate_fn, require)
+    line = dump_fn(out_data)
+    _remember(key, line)
+    return line
+
+def _worker(job, prefetched=None):
+    """Konvertiert eine Datei.
+
+    Gibt (Pfad, Zielpfad bzw. JSONL-Zeile, Fehlermeldung) zurück;
+    übersprungene Dateien liefern (Pfad, None, None).
+    """
+    path, out_dir, indent, jsonl, require, incremental = job
+    try:
+        # Pro Prozess gebaut; Closures/Validatoren sind nicht picklebar
+        validate_fn = _validate_fn
+        dump_fn = make_dumper(indent, jsonl)
+        if jsonl:
+            result = convert_line(path, dump_fn, validate_fn, require, prefetched)
+        else:
+            result = convert_file(path, out_dir, indent, dump_fn, validate_fn,
+                                  require, incremental, prefetched)
+    except SkipFile:
+        return path, None, None
+    except Exception as e:
+        if not jsonl:
+            discard_stale_output(path, out_dir)
+        return path, None, str(e)  # Exceptions sind nicht immer picklebar
+    return path, result, None
+
+PREFETCH_DEPTH = 8  # so viele Dateien liest der Reader-Thread höchstens voraus
+
+def _prefetch(batch, q):
+    """Reader-Thread: liest die Rohdaten der folgenden Dateien, während geparst wird.
+
+    Große Dateien (mmap), unveränderte Ausgaben und Fehler liefern None;
+    die öffnet dann der Worker selbst. Pro Job kommt immer genau ein put,
+    sonst bliebe der Worker in q.get() hängen.
+    """
+    for path, out_dir, _, _, _, incremental in batch:
+        raw = None
+        try:
+            if not (incremental and is_up_to_date(path, out_dir / (path.stem + ".json"))):
+                if path.stat().st_size < MMAP_MIN_SIZE:
+                    raw = path.read_bytes()
+        except Exception:
+            raw = None  # Fehler meldet der Worker beim eigenen Öffnen
+        q.put(raw)
+
+def _run_batch(batch):
+    """Prozess-Einstieg: konvertiert einen Block Dateien, Lesen und Parsen überlappt."""
+    q = queue.Queue(maxsize=PREFETCH_DEPTH)
+    reader = threading.Thread(target=_prefetch, args=(batch, q), daemon=True)
+    reader.start()
+    results = [_worker(job, q.get()) for job in batch]
+    reader.join()
+    return results
+
+WRITE_BATCH_BYTES = 1 << 20  # JSONL: ein Syscall je ~1 MiB statt je Dokument
+WRITE_BATCH_LINES = 1024     # IOV_MAX unter Linux/macOS
+
+def _writev_all(fd, chunks):
+    """os.writev mit Nachschieben des Rests bei kurzem Write."""
+    written = os.writev(fd, chunks)
+    if written < sum(map(len, chunks)):
+        rest = memoryview(b"".join(chunks))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+def write_lines(fp, lines):
+    """Schreibt JSONL-Zeilen gebündelt: os.writev je Batch, sonst ein join + write."""
+    batch, size = [], 0
+    for line in lines:
+        batch.append(line)
+        size += len(line)
+        if size >= WRITE_BATCH_BYTES or len(batch) >= WRITE_BATCH_LINES:
+            _write_batch(fp, batch)
+            batch, size = [], 0
+    if batch:
+        _write_batch(fp, batch)
+
+def _write_batch(fp, batch):
+    if hasattr(os, "writev"):
+        _writev_all(fp.fileno(), batch)  # fp-Puffer bleibt leer, direkt auf den fd
+    else:
+        fp.write(b"".join(batch))
+
+STAMP_NAME = ".yaml2json.stamp"  # Optionen des letzten Laufs im Zielordner
+
+def options_stamp(schema, indent) -> str:
+    """Fingerprint der Optionen, die den JSON-Inhalt bestimmen."""
+    raw = json.dumps([schema, indent], sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 def walk_inputs(input_path: Path):
-    return (
-        [input_path] if input_path.is_file()
-        else sorted(input_path.rglob("*.yml")) + sorted(input_path.rglob("*.yaml"))
-    )
+    if input_path.is_file():
+        return [input_path]
+    # Ein scandir-Durchlauf für beide Endungen statt zweier rglob-Walks
+    found, stack = [], [str(input_path)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue  # wie rglob: nicht lesbare Verzeichnisse überspringen
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith((".yml", ".yaml")):
+                    found.append(Path(entry.path))
+    # Reihenfolge wie bisher: erst alle .yml, dann alle .yaml, jeweils sortiert
+    found.sort(key=lambda p: (p.suffix == ".yaml", p))
+    return found
+
+def group_by_target(files):
+    """Gruppiert Dateien nach Ziel-JSON (Stem), in Reihenfolge des ersten Auftretens.
+
+    Dateien mit gleichem Stem schreiben dieselbe .json; sie bleiben in einer
+    Gruppe und damit im selben Worker-Block, sodass wie früher seriell die
+    letzte in Eingabereihenfolge gewinnt.
+    """
+    groups = {}
+    for f in files:
+        groups.setdefault(f.stem, []).append(f)
+    return list(groups.values())
+
+def pack_batches(groups, size):
+    """Füllt Blöcke von etwa size Jobs, ohne eine Gruppe zu teilen."""
+    batches, batch = [], []
+    for group in groups:
+        batch.extend(group)
+        if len(batch) >= size:
+            batches.append(batch)
+            batch = []
+    if batch:
+        batches.append(batch)
+    return batches
 
 def main():
     ap = argparse.ArgumentParser(description="YAML → JSON Converter")
     ap.add_argument("src", type=Path, help="Datei oder Verzeichnis mit YAML")
     ap.add_argument("--out", type=Path, help="Zielordner")
     ap.add_argument("--schema", type=Path, help="JSON-Schema (optional)")
-    ap.add_argument("--indent", type=int, default=2)
+    ap.add_argument("--indent", type=int, default=0,
+                    help="Einrückung (default 0: kompakt; 2 für lesbares JSON)")
+    ap.add_argument("--quiet", action="store_true", help="Keine Zeile pro Datei ausgeben")
+    ap.add_argument("--jsonl", type=Path, help="Alle Dokumente in eine JSON-Lines-Datei")
+    ap.add_argument("--require-key", metavar="KEY[=VALUE]",
+                    help="Nur Dateien mit diesem Schlüssel (muss in den ersten 4 KiB stehen)")
+    ap.add_argument("--force", action="store_true",
+                    help="Auch unveränderte Dateien neu umwandeln")
     args = ap.parse_args()
 
     if not args.src.exists():
         sys.exit("❌  Eingabepfad existiert nicht.")
 
     out_dir = args.out or args.src.parent / "json_out"
-    out_dir.mkdir(parents=True, exist_ok=True)
+    if args.jsonl:
+        args.jsonl.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        out_dir.mkdir(parents=True, exist_ok=True)
 
     schema = None
     if args.schema:
-        if jsonschema is None:
-            sys.exit("❌  jsonschema-Paket nicht installiert.")
+        if jsonschema is None and fastjsonschema is None:
+            sys.exit("❌  jsonschema- oder fastjsonschema-Paket nicht installiert.")
         schema = json.loads(args.schema.read_text(encoding="utf-8"))
+        try:
+            _init_worker(schema)  # Schema einmal vorab prüfen; gilt auch für den Einzeldatei-Pfad
+        except Exception as e:
+            sys.exit(f"❌  Ungültiges JSON-Schema: {e}")
 
     files = walk_inputs(args.src)
     if not files:
         sys.exit("⚠️  Keine YAML-Dateien gefunden.")
 
+    require = parse_require(args.require_key) if args.require_key else None
+    if require:
+        # Dateianfang statt kompletter libyaml-Parse für die meisten Nicht-Treffer
+        found = len(files)
+        files = [f for f in files if head_has_key(f, require[0])]
+        print(f"🔎  {found - len(files)} von {found} Dateien ohne '{args.require_key.partition('=')[0]}' übersprungen")
+        if not files:
+            sys.exit("⚠️  Keine passenden YAML-Dateien gefunden.")
+
+    # Inkrementell nur, wenn Schema und Einrückung wie beim letzten vollen Lauf sind;
+    # mit --schema nie, da ältere Ausgaben unvalidiert sein können
+    stamp_path, stamp = out_dir / STAMP_NAME, options_stamp(schema, args.indent)
+    try:
+        old_stamp = stamp_path.read_text(encoding="utf-8")
+    except OSError:
+        old_stamp = None
+    incremental = not (args.force or args.jsonl or schema) and old_stamp == stamp
+    full_run = args.src.is_dir() and not require
+
     print(f"🏁  Starte Konvertierung ({len(files)} Dateien)  –  {datetime.now():%H:%M:%S}")
-    for f in files:
-        try:
-            convert_file(f, out_dir, schema, args.indent)
-        except Exception as e:
-            print(f"⚠️  Fehler in {f}: {e}")
+    if args.jsonl:
+        groups = [[f] for f in files]
+    else:
+        groups = group_by_target(files)
+        for group in groups:
+            if len(group) > 1:
+                names = ", ".join(str(f) for f in group)
+                print(f"⚠️  Gleicher Zielname {group[0].stem}.json: {names} (letzte gewinnt)")
+    job = lambda f: (f, out_dir, args.indent, bool(args.jsonl), require, incremental)
+    if len(files) == 1:
+        results = [_worker(job(files[0]))]
+    else:
+        # Dateien sind unabhängig → auf alle Kerne verteilen, in Chunks gegen IPC-Overhead
+        chunksize = max(1, len(files) // ((os.cpu_count() or 1) * 4))
+        batches = [[job(f) for f in batch] for batch in pack_batches(groups, chunksize)]
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(schema,)) as ex:
+            results = [r for batch in ex.map(_run_batch, batches) for r in batch]
+    # Ausgabe gesammelt im Elternprozess statt print pro Datei;
+    # im JSONL-Modus schreibt nur der Elternprozess, in Eingabereihenfolge
+    # Präfix einmal als String statt relative_to (Pfadteile in Python) pro Datei
+    base = os.path.join(os.fspath(out_dir.parent), "")
+    lines, skipped, jsonl_lines = [], 0, []
+    for f, result, err in results:
+        if err is not None:
+            lines.append(f"⚠️  Fehler in {f}: {err}\n")
+            continue
+        if result is None:
+            skipped += 1  # erst beim Parsen als unpassend erkannt (--require-key)
+            continue
+        if args.jsonl:
+            jsonl_lines.append(result)
+            target = args.jsonl.name
+        else:
+            target = os.fspath(result)
+            if target.startswith(base):
+                target = target[len(base):]
+        if not args.quiet:
+            lines.append(f"✔  {f.name}  →  {target}\n")
+    if args.jsonl:
+        with args.jsonl.open("wb") as fp:
+            write_lines(fp, jsonl_lines)
+    if skipped:
+        lines.append(f"🔎  {skipped} weitere Dateien ohne passenden Schlüssel übersprungen\n")
+    sys.stdout.writelines(lines)
+
+    if not args.jsonl:
+        if full_run:
+            stamp_path.write_text(stamp, encoding="utf-8")
+        elif old_stamp is not None and old_stamp != stamp:
+            # Teillauf mit anderen Optionen: Stempel passt nicht mehr zu allen Ausgaben
+            stamp_path.unlink(missing_ok=True)
 
-    print(f"✅  Fertig. JSON-Dateien liegen in  {out_dir.resolve()}")
+    if args.jsonl:
+        print(f"✅  Fertig. JSON Lines liegen in  {args.jsonl.resolve()}")
+    else:
+        print(f"✅  Fertig. JSON-Dateien liegen in  {out_dir.resolve()}")
 
 if __name__ == "__main__":
     main()